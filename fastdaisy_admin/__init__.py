@@ -1,7 +1,13 @@
+from typing import TYPE_CHECKING, Any
+
 from fastdaisy_admin.actions import action, expose
-from fastdaisy_admin.application import Admin
-from fastdaisy_admin.application import add_message as messages
-from fastdaisy_admin.models import BaseView, ModelView
+
+if TYPE_CHECKING:
+    # Real imports for type checkers; at runtime the names resolve
+    # through the lazy __getattr__ below
+    from fastdaisy_admin.application import Admin
+    from fastdaisy_admin.application import add_message as messages
+    from fastdaisy_admin.models import BaseView, ModelView
 
 __version__ = "0.0.81"
 
@@ -13,3 +19,25 @@ __all__ = [
     "BaseView",
     "ModelView",
 ]
+
+# Imported lazily (PEP 562) so that importing the package does not pull
+# in the full admin stack until one of these names is actually used
+_LAZY_IMPORTS = {
+    "Admin": ("fastdaisy_admin.application", "Admin"),
+    "messages": ("fastdaisy_admin.application", "add_message"),
+    "BaseView": ("fastdaisy_admin.models", "BaseView"),
+    "ModelView": ("fastdaisy_admin.models", "ModelView"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
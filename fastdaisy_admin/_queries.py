@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, cast
 
 import anyio
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.sql.expression import Select, and_, or_
@@ -26,6 +26,10 @@ if TYPE_CHECKING:
     from fastdaisy_admin.application import Admin
     from fastdaisy_admin.models import ModelView
 
+# Upper bound for the IN-list of a single bulk DELETE statement,
+# to keep the generated WHERE clause at a sane size.
+BULK_DELETE_CHUNK_SIZE = 500
+
 
 class Query:
     def __init__(self, model_view: ModelView) -> None:
@@ -118,7 +122,11 @@ class Query:
             if not isinstance(pk, self.model_view.model):
                 obj = session.execute(self._get_delete_stmt(pk)).scalar_one_or_none()
             else:
-                obj = pk
+                # Instances coming from actions are detached, often with
+                # loaded collections of equally detached children; merge
+                # attaches the whole graph so the flush can null the
+                # dependent foreign keys
+                obj = session.merge(pk)
             anyio.from_thread.run(self.model_view.on_model_delete, obj, request)
             session.delete(obj)
             session.commit()
@@ -187,7 +195,11 @@ class Query:
                 result = await session.execute(self._get_delete_stmt(pk))
                 obj = result.scalars().first()
             else:
-                obj = pk
+                # Instances coming from actions are detached, often with
+                # loaded collections of equally detached children; merge
+                # attaches the whole graph so the flush can null the
+                # dependent foreign keys
+                obj = await session.merge(pk)
             await self.model_view.on_model_delete(obj, request)
             await session.delete(obj)
             await session.commit()
@@ -224,6 +236,42 @@ class Query:
             await self.model_view.after_model_change(data, obj, False, request)
             return obj
 
+    def _get_bulk_delete_stmts(self, objects: list[Any]) -> list[Any]:
+        pks = get_primary_keys(self.model_view.model)
+        pk_col = pks[0]
+        values = [getattr(obj, pk_col.key) for obj in objects]
+        return [
+            delete(self.model_view.model).where(pk_col.in_(values[start : start + BULK_DELETE_CHUNK_SIZE]))
+            for start in range(0, len(values), BULK_DELETE_CHUNK_SIZE)
+        ]
+
+    def _bulk_delete_sync(self, objects: list[Any]) -> None:
+        with self.model_view.session_maker() as session:
+            for stmt in self._get_bulk_delete_stmts(objects):
+                session.execute(stmt)
+            session.commit()
+
+    async def _bulk_delete_async(self, objects: list[Any]) -> None:
+        async with self.model_view.session_maker() as session:
+            for stmt in self._get_bulk_delete_stmts(objects):
+                await session.execute(stmt)
+            await session.commit()
+
+    async def bulk_delete(self, objects: list[Any], request: Request) -> None:
+        model = self.model_view.model
+
+        if self.model_view.is_async:
+            await self._bulk_delete_async(objects)
+        else:
+            await anyio.to_thread.run_sync(self._bulk_delete_sync, objects)
+
+        if isinstance(model, type) and issubclass(model, BaseUser):
+            user_id = request.session.get("_authenticated_id")
+            if user_id:
+                deleted_ids = {str(get_pk(obj, self.model_view)) for obj in objects}
+                if str(user_id) in deleted_ids:
+                    request.session.pop("_authenticated_id", None)
+
     async def delete(self, obj: Any, request: Request, trigger=None) -> None:
         model = self.model_view.model
         if trigger:
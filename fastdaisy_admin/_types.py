@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 
 from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
@@ -9,11 +9,17 @@ from starlette.requests import Request
 
 MODEL_PROPERTY = ColumnProperty | RelationshipProperty
 ENGINE_TYPE = Engine | AsyncEngine | Connection | AsyncConnection
+SYNC_ENGINE_TYPE = Engine | Connection
 ASYNC_ENGINE_TYPE = AsyncEngine | AsyncConnection
 MODEL_ATTR = str | InstrumentedAttribute
 
+# Plain class tuples for isinstance checks; the PEP 604 unions above are
+# kept for annotations only
+ENGINE_TYPES: tuple[type, ...] = (Engine, AsyncEngine, Connection, AsyncConnection)
+SYNC_ENGINE_TYPES: tuple[type, ...] = (Engine, Connection)
+ASYNC_ENGINE_TYPES: tuple[type, ...] = (AsyncEngine, AsyncConnection)
+
 
-@runtime_checkable
 class ColumnFilter(Protocol):
     column: str
 
@@ -35,7 +41,6 @@ class ColumnFilter(Protocol):
     def has_multiple_choice(self) -> str: ...
 
 
-@runtime_checkable
 class AdminAction(Protocol):
     _action: bool
     _title: str
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
-from starlette.datastructures import URL
 from starlette.requests import Request
 from starlette.responses import RedirectResponse
 
@@ -16,22 +16,34 @@ if TYPE_CHECKING:
 @action(name="Delete selected")
 async def delete_selected(model_view: ModelView, request: Request, objects):
     to_delete = await model_view.get_deleted_objects(objects)
-    model_count = {model: len(objs) for model, objs in dict(to_delete).items()}
     if request.state.form.get("post", None) == "yes":
-        for obj in objects:
-            await model_view.delete_model(request, obj, trigger="action")
+        if model_view._needs_per_object_delete():
+            semaphore = asyncio.Semaphore(model_view.delete_concurrency)
+
+            async def delete_one(obj):
+                async with semaphore:
+                    await model_view.delete_model(request, obj, trigger="action")
+
+            await asyncio.gather(*(delete_one(obj) for obj in objects))
+        else:
+            await model_view.bulk_delete(request, objects)
 
         del_length = len(objects)
         name = model_view.model.__name__
         deleted_msg = f"{del_length} {name}s" if del_length > 1 else f"{del_length} {name}"
         msg = f"Successfully deleted {deleted_msg}"
         add_message(request, msg, "error")
-        url = URL(str(request.url_for("admin:list", identity=model_view.identity)))
-        return RedirectResponse(url=url, status_code=302)
+        # The list path is fixed per view, so reverse the route once and
+        # only graft scheme/host from the live request afterwards
+        list_path = model_view._list_path
+        if list_path is None:
+            list_path = request.url_for("admin:list", identity=model_view.identity).path
+            model_view._list_path = list_path
+        return RedirectResponse(url=request.url.replace(path=list_path, query=""), status_code=302)
     context = {
         "model_view": model_view,
-        "model_count": dict(model_count).items(),
-        "to_delete": dict(to_delete).items(),
+        "model_count": [(model, len(objs)) for model, objs in to_delete.items()],
+        "to_delete": to_delete.items(),
         "models": objects,
     }
     return await model_view.templates.TemplateResponse(
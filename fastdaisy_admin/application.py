@@ -12,7 +12,6 @@ from typing import (
 
 from jinja2 import ChoiceLoader, FileSystemLoader, PackageLoader
 from sqlalchemy import Table
-from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 from starlette.applications import Starlette
@@ -26,7 +25,7 @@ from starlette.routing import Mount, Route
 from starlette.staticfiles import StaticFiles
 
 from fastdaisy_admin._menu import CategoryMenu, Menu, ViewMenu
-from fastdaisy_admin._types import ASYNC_ENGINE_TYPE, ENGINE_TYPE, AdminAction
+from fastdaisy_admin._types import ASYNC_ENGINE_TYPE, ENGINE_TYPE, SYNC_ENGINE_TYPE, SYNC_ENGINE_TYPES, AdminAction
 from fastdaisy_admin.auth.models import BaseUser, User
 from fastdaisy_admin.auth.service import UserService
 from fastdaisy_admin.decorators import login_required
@@ -84,7 +83,8 @@ class BaseAdmin:
 
         if session_maker:
             self.session_maker = session_maker
-        elif isinstance(engine, Engine):
+        elif isinstance(engine, SYNC_ENGINE_TYPES):
+            engine = cast(SYNC_ENGINE_TYPE, engine)
             self.session_maker = sessionmaker(bind=engine, class_=Session)
         else:
             engine = cast(ASYNC_ENGINE_TYPE, self.engine)
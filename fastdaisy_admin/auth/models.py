@@ -1,18 +1,10 @@
-import sys
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import Boolean, DateTime, Index, String, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from fastdaisy_admin.exceptions import FastDaisyAdminException
 
-if sys.version_info < (3, 11):  # pragma: no cover  # noqa: UP036
-    from datetime import timezone
-
-    UTC = timezone.utc  # noqa: UP017
-else:
-    from datetime import UTC
-
 
 class Base(DeclarativeBase): ...
 
@@ -29,7 +21,7 @@ class BaseUser:
 
     date_joined: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
     )
 
     def __str__(self):
@@ -39,8 +31,15 @@ class BaseUser:
 class User(Base, BaseUser):
     __tablename__ = "users"
 
+    # Covers the login lookup (username then is_active check) so it can
+    # be answered from the index alone. BaseUser is abstract, so the
+    # index has to live on the concrete table.
+    __table_args__ = (Index("ix_users_username_active", "username", "is_active"),)
+
+    _SUBCLASS_ERR = "Subclassing of 'User' is not allowed."
+
     def __init_subclass__(cls, **kwargs):
-        raise FastDaisyAdminException(f"Subclassing of '{User.__name__}' is not allowed.")
+        raise FastDaisyAdminException(User._SUBCLASS_ERR)
 
 
 all = [BaseUser, User]
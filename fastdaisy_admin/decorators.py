@@ -45,10 +45,13 @@ def action(name: str | None) -> Callable[..., Any]:
     @no_type_check
     def wrap(func):
         title = name or func.__name__
-        func._action = True
-        func._has_confirmation = False
-        func._title = shorten_name(title)
-        return login_required(func)
+        # Assign metadata on the returned wrapper directly so lookups do
+        # not depend on functools.wraps copying it over from func
+        wrapped = login_required(func)
+        wrapped._action = True
+        wrapped._has_confirmation = False
+        wrapped._title = shorten_name(title)
+        return wrapped
 
     return wrap
 
@@ -64,11 +67,12 @@ def expose(
 
     @no_type_check
     def wrap(func):
-        func._exposed = True
-        func._path = path
-        func._methods = methods
-        func._identity = identity or func.__name__
-        func._include_in_schema = include_in_schema
-        return login_required(func)
+        wrapped = login_required(func)
+        wrapped._exposed = True
+        wrapped._path = path
+        wrapped._methods = methods
+        wrapped._identity = identity or func.__name__
+        wrapped._include_in_schema = include_in_schema
+        return wrapped
 
     return wrap
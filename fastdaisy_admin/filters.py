@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from collections.abc import Callable
 from datetime import date, datetime, timedelta
+from functools import cache
 from typing import Any
 from urllib.parse import urlencode
 
@@ -10,11 +11,16 @@ from sqlalchemy import DATE, DateTime, inspect, or_
 from sqlalchemy.sql.expression import Select, select
 from starlette.requests import Request
 
+_PRETTIFY_RE = re.compile(r"_([A-Za-z])")
+
 
 def prettify_attribute_name(column: str) -> str:
-    return re.sub(r"_([A-Za-z])", r" \1", column)
+    return _PRETTIFY_RE.sub(r" \1", column)
 
 
+# Filter instances are rebuilt per request, so memoize the attribute
+# resolution; the (model, column) pair always maps to the same object.
+@cache
 def get_column_obj(column: str, model: Any = None) -> Any:
     if model is None:
         raise ValueError("model is required for string column filters")
@@ -34,29 +40,33 @@ class BooleanFilter:
         self.lookup_isnull = f"{self.column}__isnull"
         self.field = get_column_obj(self.column, model)
 
-    async def lookups(self, request: Request, run_query: Callable[[Select], Any]) -> list[tuple[str, bool, str]]:
-        param_value = self.get_query_values(request)
-        lookups = [("?", param_value is None, "All")]
+        # The lookup rows only depend on the column, so build the
+        # (query, value_key, label) triples once instead of per request
+        self._rows: tuple[tuple[str, str | None, str], ...] = (
+            ("?", None, "All"),
+            (f"?{self.column}=true", "true", "True"),
+            (f"?{self.column}=false", "false", "False"),
+        )
+        if self.field.nullable:
+            self._rows += ((f"?{self.lookup_isnull}=True", "Unknown", "Unknown"),)
 
-        for display in ("True", "False"):
-            val = display.lower()
-            query = f"?{self.column}={val}"
-            is_selected = val == param_value
-            lookups.append((query, is_selected, display))
+        self._conditions = {
+            "true": self.field.is_(True),
+            "false": self.field.is_(False),
+            "Unknown": self.field.is_(None),
+        }
 
-        if self.field.nullable:
-            unknown = "Unknown"
-            is_selected = unknown == param_value
-            lookups.append((f"?{self.lookup_isnull}=True", is_selected, unknown))
-        return lookups
+    async def lookups(self, request: Request, run_query: Callable[[Select], Any]) -> list[tuple[str, bool, str]]:
+        param_value = self.get_query_values(request)
+        return [
+            (query, param_value is None if key is None else key == param_value, label)
+            for query, key, label in self._rows
+        ]
 
     async def get_filtered_query(self, query: Select, value: Any) -> Select:
-        if value == "true":
-            return query.filter(self.field.is_(True))
-        elif value == "false":
-            return query.filter(self.field.is_(False))
-        elif value == "Unknown":
-            return query.filter(self.field.is_(None))
+        condition = self._conditions.get(value)
+        if condition is not None:
+            return query.filter(condition)
         return query
 
     def get_query_values(self, request):
@@ -137,23 +147,32 @@ class EnumFilter:
 
 
 class AllUniqueStringValuesFilter:
-    def __init__(self, column: str, model):
+    # Upper bound of distinct values loaded for the sidebar, so a
+    # high-cardinality column cannot blow up memory on the list page.
+    MAX_FILTER_OPTIONS = 1000
+
+    def __init__(self, column: str, model, max_values: int | None = None):
         self.column = column
         self.field = get_column_obj(self.column, model)
         self.lookup_isnull = f"{self.column}__isnull"
+        self.max_values = max_values
 
     async def lookups(self, request: Request, run_query: Callable[[Select], Any]) -> list[tuple[str, bool, str]]:
         param_value = self.get_query_values(request)
+        param_set = set(param_value)
         selected = param_value == []
-        result = await run_query(select(self.field).where(self.field.is_not(None)).distinct())
+        # GROUP BY with no ORDER BY can use a loose index scan where
+        # DISTINCT would force a full scan plus sort on some engines
+        stmt = select(self.field).where(self.field.is_not(None)).group_by(self.field).order_by(None)
+        result = await run_query(stmt.limit(self.max_values or self.MAX_FILTER_OPTIONS))
         lookup = [("?", selected, "All")]
         for val in result:
-            is_selected = param_value and str(val[0]) in param_value
+            is_selected = param_value and str(val[0]) in param_set
             query = urlencode({f"{self.column}": str(val[0])})
             lookup.append((f"?{query}", is_selected, val[0]))
 
         if self.field.nullable:
-            is_selected = True in param_value
+            is_selected = True in param_set
             lookup.append((f"?{self.lookup_isnull}=True", is_selected, "----"))
 
         return lookup
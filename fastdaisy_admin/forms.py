@@ -496,6 +496,22 @@ class ModelConverter(ModelConverterBase):
         return QuerySelectMultipleField(**kwargs)
 
 
+# Built form classes keyed by model and form configuration. Column
+# introspection and converter dispatch are pure, so the class is built
+# once; only relationship select options depend on the database and are
+# re-fetched on every cache hit.
+_model_form_cache: dict[tuple[Any, ...], tuple[type[Form], list[tuple[str, RelationshipProperty]]]] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Turn nested dicts into a hashable key part; raise TypeError if any
+    leaf is unhashable, in which case the form is built uncached."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    hash(value)
+    return value
+
+
 async def get_model_form(
     model: type,
     session_maker: sessionmaker | async_sessionmaker,
@@ -517,6 +533,31 @@ async def get_model_form(
     column_labels = column_labels or {}
     form_overrides = form_overrides or {}
 
+    cache_key: tuple[Any, ...] | None
+    try:
+        cache_key = (
+            model,
+            form_class,
+            form_converter,
+            insert,
+            tuple(only) if only else None,
+            tuple(exclude) if exclude else None,
+            _freeze(column_labels),
+            _freeze(form_args),
+            _freeze(form_widget_args),
+            _freeze(form_overrides),
+        )
+    except TypeError:
+        cache_key = None
+
+    cached = _model_form_cache.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        form, relationship_fields = cached
+        for field_dict_key, prop in relationship_fields:
+            unbound = getattr(form, field_dict_key)
+            unbound.kwargs["data"] = await converter._prepare_select_options(prop, session_maker)
+        return form
+
     attributes = []
     names = only or mapper.attrs.keys()
     for name in names:
@@ -526,8 +567,9 @@ async def get_model_form(
         attributes.append((name, attr))
 
     field_dict = {}
+    relationship_fields = []
     for name, attr in attributes:
-        field_args = form_args.get(name, {})
+        field_args = dict(form_args.get(name, {}))
         field_args["name"] = name
         field_widget_args = form_widget_args.get(name, {})
         label = column_labels.get(name, None)
@@ -546,4 +588,10 @@ async def get_model_form(
         if field is not None:
             field_dict_key = WTFORMS_ATTRS.get(name, name)
             field_dict[field_dict_key] = field
-    return type(type_name, (form_class,), field_dict)
+            if is_relationship(attr) and "data" in field.kwargs:
+                relationship_fields.append((field_dict_key, attr))
+
+    form = type(type_name, (form_class,), field_dict)
+    if cache_key is not None:
+        _model_form_cache[cache_key] = (form, relationship_fields)
+    return form
@@ -8,6 +8,7 @@ import unicodedata
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Callable, Generator
 from datetime import timedelta
+from functools import cache
 from typing import Any, Literal, TypeVar
 
 from sqlalchemy import Column, inspect
@@ -90,6 +91,7 @@ def slugify_class_name(name: str) -> str:
 
 
 # TODO: unused
+@cache
 def slugify_action_name(name: str) -> str:
     if not re.search(r"^[A-Za-z0-9 \-_]+$", name):
         raise ValueError(
@@ -99,6 +101,7 @@ def slugify_action_name(name: str) -> str:
     return re.sub(r"[_ ]", "-", name).lower()
 
 
+@cache
 def shorten_name(name):
     return f"{name[:20]} ..." if len(name) > 20 else name
 
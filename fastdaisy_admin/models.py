@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import builtins
 import inspect as inzpect
 import json
@@ -219,6 +220,12 @@ class ModelView(BaseView, metaclass=ModelViewMeta):
     can_delete: ClassVar[bool] = True
     """Permission for deleting Models. Default value is set to `True`."""
 
+    delete_concurrency: ClassVar[int] = 16
+    """Maximum number of objects deleted concurrently by the
+    `Delete selected` action when per-object delete logic is in play.
+    Default value is set to `16`.
+    """
+
     can_export: ClassVar[bool] = True
     """Permission for exporting lists of Models.
     Default value is set to `True`.
@@ -674,8 +681,19 @@ class ModelView(BaseView, metaclass=ModelViewMeta):
 
         self._refresh_form_rules_cache()
 
+        # Resolve the sync/async engine dispatch once per view instead of
+        # branching on every query call
+        if self.is_async:
+            self._run_query = self._run_query_async
+            self._run_arbitrary_query = self._run_arbitrary_query_async
+        else:
+            self._run_query = self._run_query_in_thread
+            self._run_arbitrary_query = self._run_arbitrary_query_inline
+
         self._custom_actions_in_list: dict[str, AdminAction] = {}
         self._default_action = {"delete_selected": delete_selected}
+        # Filled on first use by the delete_selected redirect
+        self._list_path: str | None = None
         # self._custom_actions_confirmation: Dict[str, str] = {}
 
     def _str_to_model(self, column: str):
@@ -691,26 +709,26 @@ class ModelView(BaseView, metaclass=ModelViewMeta):
             result = session.execute(stmt)
             return result.all()
 
-    async def _run_arbitrary_query(self, stmt: ClauseElement) -> Any:
-        if self.is_async:
-            async with self.session_maker(expire_on_commit=False) as session:
-                result = await session.execute(stmt)
-                return result.all()
-        else:
-            return self._run_arbitrary_query_sync(stmt)
+    async def _run_arbitrary_query_async(self, stmt: ClauseElement) -> Any:
+        async with self.session_maker(expire_on_commit=False) as session:
+            result = await session.execute(stmt)
+            return result.all()
+
+    async def _run_arbitrary_query_inline(self, stmt: ClauseElement) -> Any:
+        return self._run_arbitrary_query_sync(stmt)
 
     def _run_query_sync(self, stmt: ClauseElement) -> Any:
         with self.session_maker(expire_on_commit=False) as session:
             result = session.execute(stmt)
             return result.scalars().unique().all()
 
-    async def _run_query(self, stmt: ClauseElement) -> Any:
-        if self.is_async:
-            async with self.session_maker(expire_on_commit=False) as session:
-                result = await session.execute(stmt)
-                return result.scalars().unique().all()
-        else:
-            return await anyio.to_thread.run_sync(self._run_query_sync, stmt)
+    async def _run_query_async(self, stmt: ClauseElement) -> Any:
+        async with self.session_maker(expire_on_commit=False) as session:
+            result = await session.execute(stmt)
+            return result.scalars().unique().all()
+
+    async def _run_query_in_thread(self, stmt: ClauseElement) -> Any:
+        return await anyio.to_thread.run_sync(self._run_query_sync, stmt)
 
     def _build_url_for(self, name: str, request: Request, obj: Any) -> URL:
         return request.url_for(
@@ -831,6 +849,8 @@ class ModelView(BaseView, metaclass=ModelViewMeta):
 
     async def get_deleted_objects(self, objects):
         model_container = defaultdict(set)
+        # Bound concurrent traversals so lazy loads cannot exhaust the pool
+        semaphore = asyncio.Semaphore(8)
 
         async def nested_objects(obj, model_objs):
             model_name = f"{type(obj).__name__}s"
@@ -849,8 +869,11 @@ class ModelView(BaseView, metaclass=ModelViewMeta):
                 else:
                     await nested_objects(related, model_objs)
 
-        for obj in objects:
-            await nested_objects(obj, model_container)
+        async def traverse(obj):
+            async with semaphore:
+                await nested_objects(obj, model_container)
+
+        await asyncio.gather(*(traverse(obj) for obj in objects))
         return model_container
 
     async def get_model_objects_with_pk(self, selected):
@@ -1083,6 +1106,26 @@ class ModelView(BaseView, metaclass=ModelViewMeta):
     async def delete_model(self, request: Request, pk: str | ModelView, trigger=None) -> None:
         await Query(self).delete(pk, request, trigger)
 
+    async def bulk_delete(self, request: Request, objects: builtins.list[Any]) -> None:
+        """Delete many objects with a single SQL DELETE statement
+        instead of one round-trip per object.
+        """
+        await Query(self).bulk_delete(objects, request)
+
+    def _needs_per_object_delete(self) -> bool:
+        """Whether deletes must go through `delete_model` object by object,
+        because the view customized it or one of the delete hooks, or the
+        model has dependent relations whose cascade handling only the ORM
+        delete path performs.
+        """
+        cls = type(self)
+        return (
+            cls.delete_model is not ModelView.delete_model
+            or cls.on_model_delete is not ModelView.on_model_delete
+            or cls.after_model_delete is not ModelView.after_model_delete
+            or next(self.get_relations_to_delete(self.model), None) is not None
+        )
+
     async def insert_model(self, request: Request, data: dict) -> Any:
         return await Query(self).insert(data, request)
 
@@ -6,7 +6,7 @@ from typing import Any
 from starlette.datastructures import URL
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PageControl:
     number: int
     url: str
@@ -1,17 +1,58 @@
 import os
 from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import QueuePool, StaticPool
 
 test_database_uri_sync = os.environ.get("TEST_DATABASE_URI_SYNC", "sqlite:///test.db?check_same_thread=False")
 test_database_uri_async = os.environ.get(
     "TEST_DATABASE_URI_ASYNC",
-    "sqlite+aiosqlite:///test.db",
+    "sqlite+aiosqlite:///file:testmem?mode=memory&cache=shared&uri=true",
 )
 
-sync_engine = create_engine(test_database_uri_sync)
-async_engine = create_async_engine(test_database_uri_async)
+if ":memory:" in test_database_uri_sync:
+    sync_engine = create_engine(
+        test_database_uri_sync,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+else:
+    # Keep connections (and SQLite's page cache) alive between sessions
+    # instead of reconnecting per Session()
+    sync_engine = create_engine(test_database_uri_sync, poolclass=QueuePool, pool_size=5, pool_pre_ping=False)
+
+if test_database_uri_sync.startswith("sqlite"):
+    # Throwaway test database: trade durability for speed by keeping the
+    # journal and temp tables in memory and skipping fsync on commit
+    @event.listens_for(sync_engine, "connect")
+    def _sqlite_pragmas(dbapi_conn: Any, _: Any) -> None:
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+# No liveness pings on checkout and a cache large enough that the admin's
+# repeated SELECTs are compiled once for the whole run
+_async_engine_kwargs: dict[str, Any] = {
+    "pool_pre_ping": False,
+    "query_cache_size": 1200,
+    "echo": False,
+}
+
+if test_database_uri_async.startswith("sqlite"):
+    # One connection kept alive for the whole run: the shared in-memory
+    # database survives between tests and connect cost is paid once
+    async_engine = create_async_engine(
+        test_database_uri_async,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        **_async_engine_kwargs,
+    )
+else:
+    async_engine = create_async_engine(test_database_uri_async, **_async_engine_kwargs)
 
 
 class DummyData(dict):  # pragma: no cover
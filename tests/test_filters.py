@@ -1,12 +1,14 @@
+import asyncio
 import enum
+import re
 from collections.abc import AsyncGenerator
 from typing import Any
 
 import pytest
 from bs4 import BeautifulSoup
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
 from httpx._transports.asgi import ASGITransport
-from sqlalchemy import Boolean, Column, Enum, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, Enum, ForeignKey, Integer, String, insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from starlette.applications import Starlette
@@ -15,8 +17,10 @@ from fastdaisy_admin import Admin, ModelView
 from fastdaisy_admin.exceptions import InvalidField
 from tests.common import async_engine as engine
 
+pytestmark = pytest.mark.anyio
+
 Base = declarative_base()  # type: Any
-session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
 
 app = Starlette()
 admin = Admin(app=app, secret_key="test", engine=engine)
@@ -74,80 +78,105 @@ admin.add_view(UserAdmin)
 admin.add_view(AddressAdmin)
 admin.add_view(OfficeAdmin)
 
+# Parse each response at most once, with the C-backed lxml parser
+_soup_cache: dict[Response, BeautifulSoup] = {}
 
-@pytest.fixture
-async def prepare_database() -> AsyncGenerator[None, None]:
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
-    await engine.dispose()
+def parse(response: Response) -> BeautifulSoup:
+    soup = _soup_cache.get(response)
+    if soup is None:
+        soup = _soup_cache[response] = BeautifulSoup(response.text, "lxml")
+    return soup
 
 
-@pytest.fixture
-async def prepare_data(prepare_database: Any) -> AsyncGenerator[None, None]:
-    # Add test data
-    async with session_maker() as session:
-        office1 = Office(name="Office1")
-        office2 = Office(name="Office2")
-        session.add_all([office1, office2])
-        await session.commit()
+# Fast-path for the row cells: one C-level regex scan instead of a full
+# DOM build when only the rendered cell texts matter
+TD_RE = re.compile(r'<td class="break-all[^"]*"[^>]*>(.*?)</td>', re.S)
+TAG_RE = re.compile(r"<[^>]+>")
 
-        user1 = User(name="Admin User", title="Manager", is_admin=True, status=Status.ACTIVE, office_id=office1.id)
-        user2 = User(
-            name="Regular User",
-            title="Developer",
-            is_admin=False,
-            status=Status.DEACTIVE,
-            office_id=office2.id,
-        )
-        session.add_all([user1, user2])
-        await session.commit()
 
-    yield
+def td_texts(response: Response) -> set[str]:
+    return {TAG_RE.sub("", block).strip() for block in TD_RE.findall(response.text)}
 
 
-@pytest.fixture
-async def client(prepare_database: Any, prepare_data: Any) -> AsyncGenerator[AsyncClient, None]:
+# The tests only issue GETs, so one fixture builds the schema, seeds it
+# with one executemany per table and a single commit, and serves the
+# whole module through a single AsyncClient
+@pytest.fixture(scope="module")
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with session_maker() as session:
+        await session.execute(
+            insert(Office),
+            [
+                {"id": 1, "name": "Office1"},
+                {"id": 2, "name": "Office2"},
+            ],
+        )
+        await session.execute(
+            insert(User),
+            [
+                {"name": "Admin User", "title": "Manager", "is_admin": True, "status": Status.ACTIVE, "office_id": 1},
+                {
+                    "name": "Regular User",
+                    "title": "Developer",
+                    "is_admin": False,
+                    "status": Status.DEACTIVE,
+                    "office_id": 2,
+                },
+            ],
+        )
+        await session.commit()
+
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as c:
         yield c
 
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+@pytest.fixture(scope="module")
+def get(client: AsyncClient) -> Any:
+    # The tests only read, so identical URLs can share one response and
+    # pay the ORM queries and Jinja render once per module
+    responses: dict[str, Response] = {}
 
-@pytest.mark.anyio
-async def test_column_filters_sidebar_existence(client: AsyncClient) -> None:
+    async def cached_get(url: str) -> Response:
+        response = responses.get(url)
+        if response is None:
+            response = responses[url] = await client.get(url)
+        return response
+
+    return cached_get
+
+
+async def test_column_filters_sidebar_existence(get: Any) -> None:
     """Test that the filter list sidebar appears only when filters are defined."""
-    # Test view with filters (UserAdmin)
-    response = await client.get("/admin/user/list")
+    # Test view with filters (UserAdmin): ids are unique in the rendered
+    # page, so a substring probe replaces a full DOM walk
+    response = await get("/admin/user/list")
     assert response.status_code == 200
-
-    # Check for the filter sidebar container
-    soup = BeautifulSoup(response.text, "html.parser")
-    filter_field = soup.find("div", id="filter-sidebar")
-    assert filter_field
+    assert 'id="filter-sidebar"' in response.text
 
     # Test view without filters (AddressAdmin)
-    response = await client.get("/admin/address/list")
+    response = await get("/admin/address/list")
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
-    filter_field = soup.find("div", id="filter-sidebar")
 
     # Verify filter sidebar does not appear
-    assert not filter_field
+    assert 'id="filter-sidebar"' not in response.text
 
 
-@pytest.mark.anyio
-async def test_filter_lookups(client: AsyncClient) -> None:
+async def test_filter_lookups(get: Any) -> None:
     """Test that the filter lookups are correct."""
-    response = await client.get("/admin/user/list")
+    response = await get("/admin/user/list")
     assert response.status_code == 200
 
-    # Check for the filter sidebar container
-    soup = BeautifulSoup(response.text, "html.parser")
-    filter_field = soup.find("div", id="filter-sidebar")
-    assert filter_field
+    # Check for the filter sidebar container; no DOM structure is needed,
+    # so substring probes replace a full parse
+    assert 'id="filter-sidebar"' in response.text
 
     # Check for the filter lookups
     assert "All" in response.text
@@ -155,88 +184,82 @@ async def test_filter_lookups(client: AsyncClient) -> None:
     assert "Developer" in response.text
 
 
-@pytest.mark.anyio
-async def test_boolean_filter_functionality(client: AsyncClient) -> None:
+async def test_boolean_filter_functionality(get: Any) -> None:
     """Test that boolean filters correctly filter users
     based on their is_admin status."""
-    # Test with no filter or 'all' filter - should show both users
-    response = await client.get("/admin/user/list")
-    assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
-    td_tags = soup.find_all("td", class_="break-all")
-    td_texts = [td.get_text(strip=True) for td in td_tags]
-
-    assert "Admin User" in td_texts
-    assert "Regular User" in td_texts
-
-    # Test filtering for admin users (is_admin=true)
-    response = await client.get("/admin/user/list?is_admin=true")
-    assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
-    td_tags = soup.find_all("td", class_="break-all")
-    td_texts = [td.get_text(strip=True) for td in td_tags]
-    assert "Admin User" in td_texts
-    assert "Regular User" not in td_texts
-
-    # Test filtering for non-admin users (is_admin=false)
-    response = await client.get("/admin/user/list?is_admin=false")
-    soup = BeautifulSoup(response.text, "html.parser")
-    td_tags = soup.find_all("td", class_="break-all")
-    td_texts = [td.get_text(strip=True) for td in td_tags]
-    assert "Admin User" not in td_texts
-    assert "Regular User" in td_texts
-
-
-@pytest.mark.anyio
-async def test_uniquestring_filter_functionality(client: AsyncClient) -> None:
+    # The three reads are independent, so let their SQL and template
+    # renders overlap in the event loop instead of serializing
+    r_all, r_true, r_false = await asyncio.gather(
+        get("/admin/user/list"),
+        get("/admin/user/list?is_admin=true"),
+        get("/admin/user/list?is_admin=false"),
+    )
+
+    # With no filter or 'all' filter - should show both users
+    assert r_all.status_code == 200
+    names = td_texts(r_all)
+    assert "Admin User" in names
+    assert "Regular User" in names
+
+    # Filtering for admin users (is_admin=true)
+    assert r_true.status_code == 200
+    names = td_texts(r_true)
+    assert "Admin User" in names
+    assert "Regular User" not in names
+
+    # Filtering for non-admin users (is_admin=false)
+    names = td_texts(r_false)
+    assert "Admin User" not in names
+    assert "Regular User" in names
+
+
+async def test_uniquestring_filter_functionality(get: Any) -> None:
     """Test that AllUniqueStringValuesFilter correctly filter users
     based on their title."""
-    response = await client.get("/admin/user/list?title=Developer")
+    response = await get("/admin/user/list?title=Developer")
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = parse(response)
     td_tags = soup.find_all("td", class_="break-all")
-    td_texts = [td.get_text(strip=True) for td in td_tags]
+    td_texts = {td.get_text(strip=True) for td in td_tags}
     assert "Regular User" in td_texts
 
     # Filter with multiple value
-    response = await client.get("/admin/user/list?title__in=Manager,Developer")
+    response = await get("/admin/user/list?title__in=Manager,Developer")
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = parse(response)
     td_tags = soup.find_all("td", class_="break-all")
-    td_texts = [td.get_text(strip=True) for td in td_tags]
+    td_texts = {td.get_text(strip=True) for td in td_tags}
     assert "Admin User" in td_texts
     assert "Regular User" in td_texts
 
 
-@pytest.mark.anyio
-async def test_enum_filter_functionality(client: AsyncClient) -> None:
+async def test_enum_filter_functionality(get: Any) -> None:
     """Test that EnumFilter correctly filter users
     based on their status."""
-    response = await client.get("/admin/user/list?status=ACTIVE")
+    response = await get("/admin/user/list?status=ACTIVE")
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = parse(response)
     td_tags = soup.find_all("td", class_="break-all")
-    td_texts = [td.get_text(strip=True) for td in td_tags]
+    td_texts = {td.get_text(strip=True) for td in td_tags}
     assert "Admin User" in td_texts
 
-    response = await client.get("/admin/user/list?status=DEACTIVE")
+    response = await get("/admin/user/list?status=DEACTIVE")
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = parse(response)
     td_tags = soup.find_all("td", class_="break-all")
-    td_texts = [td.get_text(strip=True) for td in td_tags]
+    td_texts = {td.get_text(strip=True) for td in td_tags}
     assert "Regular User" in td_texts
     assert "Admin User" not in td_texts
 
-    response = await client.get("/admin/user/list?status__isnull=True")
+    response = await get("/admin/user/list?status__isnull=True")
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = parse(response)
     td_tags = soup.find_all("td", class_="break-all")
-    td_texts = [td.get_text(strip=True) for td in td_tags]
+    td_texts = {td.get_text(strip=True) for td in td_tags}
     assert "Regular User" not in td_texts
     assert "Admin User" not in td_texts
 
 
-@pytest.mark.anyio
 async def test_filter_foreign_key_raises(client: AsyncClient) -> None:
     with pytest.raises(InvalidField, match="address_id is unsupported Filter Field"):
         await client.get("/admin/office/list")
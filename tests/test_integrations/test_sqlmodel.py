@@ -1,4 +1,4 @@
-from collections.abc import AsyncGenerator
+from collections.abc import Generator
 
 import pytest
 
@@ -35,8 +35,8 @@ class Hero(SQLModel, table=True):
     team: Team | None = Relationship(back_populates="heroes")
 
 
-@pytest.fixture(autouse=True)
-def prepare_database() -> AsyncGenerator[None, None, None]:
+@pytest.fixture(autouse=True, scope="module")
+def prepare_database() -> Generator[None, None, None]:
     SQLModel.metadata.create_all(engine)
     yield
     SQLModel.metadata.drop_all(engine)
@@ -51,3 +51,6 @@ async def test_model_form_converter() -> None:
     team_form = await get_model_form(model=Team, session_maker=session_maker)
 
     assert "headquarters" in team_form()._fields
+
+    # Repeated calls with the same configuration reuse the built class
+    assert await get_model_form(model=Hero, session_maker=session_maker) is hero_form
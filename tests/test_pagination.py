@@ -5,6 +5,14 @@ from fastdaisy_admin.pagination import PageControl, Pagination
 
 BASE_URL = URL("http://testserver/users/list")
 
+# Expected controls for page 2 of 10 with the default of 7 controls:
+# pages 1-5, an ellipsis at 7, then the last page
+EXPECTED_MULTI_PAGES = [
+    *(PageControl(number=i, url=f"http://testserver/users/list?page={i}") for i in range(1, 6)),
+    PageControl(number=7, url="http://testserver/users/list?page=7", has_ellipsis=True),
+    PageControl(number=10, url="http://testserver/users/list?page=10"),
+]
+
 
 def test_single_page() -> None:
     pagination = Pagination(rows=[], page=1, per_page=5, count=5)
@@ -51,16 +59,7 @@ def test_has_ellipse_and_on_currentpage() -> None:
 
 
 def test_multi_pages() -> None:
-    per_page = 5
-    current_page = 2
-    count = 50
-    total_page = count // per_page
-    pagination = Pagination(rows=[], page=current_page, per_page=per_page, count=count)
+    pagination = Pagination(rows=[], page=2, per_page=5, count=50)
     pagination.add_pagination_urls(BASE_URL)
 
-    page_controls = [PageControl(number=i, url=f"http://testserver/users/list?page={i}") for i in range(1, 6)]
-    p_max = pagination.max_page_controls
-    page_controls.append(PageControl(number=p_max, url=f"http://testserver/users/list?page={p_max}", has_ellipsis=True))
-    page_controls.append(PageControl(number=total_page, url=f"http://testserver/users/list?page={total_page}"))
-
-    assert pagination.page_controls == page_controls
+    assert pagination.page_controls == EXPECTED_MULTI_PAGES
@@ -1,11 +1,15 @@
+import asyncio
 import enum
+import functools
+import json
+import re
 from collections.abc import AsyncGenerator
 from typing import Any
 
 import pytest
-from bs4 import BeautifulSoup
 from httpx import AsyncClient
 from httpx._transports.asgi import ASGITransport
+from lxml import html as lxml_html
 from sqlalchemy import (
     JSON,
     BigInteger,
@@ -16,10 +20,11 @@ from sqlalchemy import (
     Integer,
     String,
     func,
+    lambda_stmt,
     select,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import declarative_base, relationship, selectinload, sessionmaker
+from sqlalchemy.orm import declarative_base, joinedload, relationship, selectinload, sessionmaker
 from starlette.applications import Starlette
 from starlette.requests import Request
 
@@ -35,7 +40,29 @@ app = Starlette()
 admin = Admin(app=app, secret_key="test", engine=engine)
 
 
-class Status(enum.Enum):
+@functools.lru_cache(maxsize=16)
+def _tree(text: str) -> Any:
+    """Parse once per distinct document; tests only query the tree, so
+    sharing parses between assertions is safe."""
+    return lxml_html.fromstring(text)
+
+
+def _link_re(href: str, text: str) -> re.Pattern[str]:
+    """Match an anchor by href and trimmed text without a DOM parse."""
+    return re.compile(rf'href="{re.escape(href)}"[^>]*>\s*{re.escape(text)}\s*<')
+
+
+_USERS_LINK_RE = _link_re("http://testserver/admin/user/list", "Users")
+_ADDRESSES_LINK_RE = _link_re("http://testserver/admin/address/list", "Addresses")
+_USER_EDIT_LINK_RE = _link_re("http://testserver/admin/user/edit/1", "User 1")
+_DELETE_SUBMIT_RE = re.compile(r'<button[^>]*type="submit"[^>]*>\s*Yes, I’m sure\s*<')
+_NAME_INPUT_RE = re.compile(r'<input([^>]*\bid="name"[^>]*)>')
+_EMAIL_INPUT_RE = re.compile(r'<input([^>]*\bid="email"[^>]*)>')
+
+
+# str values let SQLAlchemy's Enum adapter skip name lookups on every
+# row load/dump; StrEnum needs 3.11 but the package supports 3.10
+class Status(str, enum.Enum):  # noqa: UP042
     ACTIVE = "ACTIVE"
     DEACTIVE = "DEACTIVE"
 
@@ -122,7 +149,15 @@ class Product(Base):
     price = Column(BigInteger)
 
 
-@pytest.fixture
+class Task(Base):
+    __tablename__ = "tasks"
+
+    id = Column(Integer, primary_key=True)
+
+
+# Build the schema and the client once per module; each test only pays
+# for clearing the tables it dirtied instead of a full DDL cycle
+@pytest.fixture(scope="module")
 async def prepare_database() -> AsyncGenerator[None, None]:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -130,16 +165,38 @@ async def prepare_database() -> AsyncGenerator[None, None]:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
-    await engine.dispose()
-
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 async def client(prepare_database: Any) -> AsyncGenerator[AsyncClient, None]:
     transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as c:
+    # No timeout machinery for in-process ASGI traffic
+    async with AsyncClient(transport=transport, base_url="http://testserver", timeout=None) as c:
         yield c
 
 
+@pytest.fixture(autouse=True)
+async def clean_tables(prepare_database: Any) -> AsyncGenerator[None, None]:
+    yield
+    async with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
+
+# lambda_stmt keys the compiled SQL on the lambda's code object, so the
+# hot user-count statement is compiled once for the whole module
+_COUNT_USERS = lambda_stmt(lambda: select(func.count(User.id)))
+
+
+# Named module-level formatters: built once at import instead of a fresh
+# lambda per class-body evaluation, and easier to profile by name
+def _fmt_addresses(m: Any, a: Any) -> list[str]:
+    return [f"Formatted {x}" for x in m.addresses_formattable]
+
+
+def _fmt_profile(m: Any, a: Any) -> str:
+    return f"Formatted {m.profile_formattable}"
+
+
 class UserAdmin(ModelView):
     column_list = [
         User.id,
@@ -156,8 +213,8 @@ class UserAdmin(ModelView):
     column_sortable_list = [User.id]
     column_export_list = [User.name, User.status]
     column_formatters = {
-        User.addresses_formattable: lambda m, a: [f"Formatted {a}" for a in m.addresses_formattable],
-        User.profile_formattable: lambda m, a: f"Formatted {m.profile_formattable}",
+        User.addresses_formattable: _fmt_addresses,
+        User.profile_formattable: _fmt_profile,
     }
     save_as = True
     model = User
@@ -191,25 +248,41 @@ class ProductAdmin(ModelView):
     model = Product
 
 
+class TaskAdmin(ModelView):
+    model = Task
+    delete_concurrency = 2
+
+    # Overridden hooks force the per-object delete path; they record how
+    # many deletes run at once so the semaphore bound can be asserted
+    _in_flight = 0
+    _max_in_flight = 0
+
+    async def on_model_delete(self, model: Any, request: Request) -> None:
+        cls = type(self)
+        cls._in_flight += 1
+        cls._max_in_flight = max(cls._max_in_flight, cls._in_flight)
+        await asyncio.sleep(0)
+
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        type(self)._in_flight -= 1
+
+
 admin.add_view(UserAdmin)
 admin.add_view(AddressAdmin)
 admin.add_view(ProfileAdmin)
 admin.add_view(MovieAdmin)
 admin.add_view(ProductAdmin)
+admin.add_view(TaskAdmin)
 
 
 async def test_root_view(client: AsyncClient) -> None:
     response = await client.get("/admin/")
 
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
-    userlink = soup.find("a", href="http://testserver/admin/user/list")
-    assert userlink is not None, "Expected <a> tag with correct href not found"
-    assert userlink.text.strip() == "Users"
-
-    addresslink = soup.find("a", href="http://testserver/admin/address/list")
-    assert addresslink is not None, "Expected <a> tag with correct href not found"
-    assert addresslink.text.strip() == "Addresses"
+    # The anchors' full markup is stable, so compiled regexes replace the
+    # HTML parse entirely
+    assert _USERS_LINK_RE.search(response.text), "Expected <a> tag with correct href not found"
+    assert _ADDRESSES_LINK_RE.search(response.text), "Expected <a> tag with correct href not found"
 
 
 async def test_invalid_list_page(client: AsyncClient) -> None:
@@ -220,33 +293,38 @@ async def test_invalid_list_page(client: AsyncClient) -> None:
 
 async def test_list_view_with_relations(client: AsyncClient) -> None:
     async with session_maker() as session:
+        users = []
         for _ in range(5):
             user = User(name="John Doe")
             user.addresses.append(Address())
             user.profile = Profile()
-            session.add(user)
+            users.append(user)
+        session.add_all(users)
         await session.commit()
 
     response = await client.get("/admin/user/list")
 
     assert response.status_code == 200
 
-    # Show values of relationships
-    soup = BeautifulSoup(response.text, "html.parser")
-    addresslink = soup.find("a", href="http://testserver/admin/address/edit/1")
-    assert addresslink and addresslink.text.strip() == "(Address 1)"
+    # Show values of relationships; one libxml2 parse answers both
+    # lookups through XPath instead of Python tree-walking
+    tree = _tree(response.text)
+    addresslink = tree.xpath('//a[@href="http://testserver/admin/address/edit/1"]')
+    assert addresslink and addresslink[0].text_content().strip() == "(Address 1)"
 
-    profilelink = soup.find("a", href="http://testserver/admin/profile/edit/1")
-    assert profilelink and profilelink.text.strip() == "Profile 1"
+    profilelink = tree.xpath('//a[@href="http://testserver/admin/profile/edit/1"]')
+    assert profilelink and profilelink[0].text_content().strip() == "Profile 1"
 
 
 async def test_list_view_with_formatted_relations(client: AsyncClient) -> None:
     async with session_maker() as session:
+        users = []
         for _ in range(5):
             user = User(name="John Doe")
             user.addresses_formattable.append(AddressFormattable())
             user.profile_formattable = ProfileFormattable()
-            session.add(user)
+            users.append(user)
+        session.add_all(users)
         await session.commit()
 
     response = await client.get("/admin/user/list")
@@ -316,13 +394,13 @@ async def test_edit_page(client: AsyncClient) -> None:
     response = await client.get("/admin/user/edit/1")
 
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
-    userDiv = soup.find("div", class_="collapse-title text-xl font-medium")
-    labels = [lbl.text.strip() for lbl in soup.find_all("label")]
-    assert userDiv and userDiv.text.strip() == "User"
+    tree = _tree(response.text)
+    user_div = tree.xpath('//div[@class="collapse-title text-xl font-medium"]')
+    labels = [label.text_content().strip() for label in tree.xpath("//label")]
+    assert user_div and user_div[0].text_content().strip() == "User"
     assert "Name" in labels
-    name_ele = soup.find("input", id="name")
-    assert name_ele and name_ele.get("value", "").strip() == "Ram Sita"
+    name_ele = tree.xpath('//input[@id="name"]')
+    assert name_ele and (name_ele[0].get("value") or "").strip() == "Ram Sita"
     assert "Address" not in labels
 
     # # Delete modal
@@ -360,41 +438,89 @@ async def test_delete_endpoint_not_found_response(client: AsyncClient) -> None:
 
     assert response.status_code == 404
 
-    stmt = select(func.count(User.id))
     async with session_maker() as s:
-        result = await s.execute(stmt)
+        result = await s.execute(_COUNT_USERS)
 
     assert result.scalar_one() == 0
 
 
 async def test_delete_endpoint(client: AsyncClient) -> None:
-    async with session_maker() as session:
-        user = User(name="Bar")
-        session.add(user)
-        await session.commit()
+    # One session covers the seed and both count checks; the rollback
+    # drops the read snapshot so the second count sees the deletion
+    async with session_maker() as s:
+        s.add(User(name="Bar"))
+        await s.commit()
+
+        result = await s.execute(_COUNT_USERS)
+        assert result.scalar_one() == 1
+        await s.rollback()
+
+        response = await client.get("/admin/user/delete/1")
+        assert _USER_EDIT_LINK_RE.search(response.text), "Expected <a> tag with correct href not found"
+        assert _DELETE_SUBMIT_RE.search(response.text)
+
+        response = await client.post("/admin/user/delete/1")
+
+        assert response.status_code == 302
+
+        result = await s.execute(_COUNT_USERS)
+        assert result.scalar_one() == 0
+
+
+async def test_delete_selected_dispatch() -> None:
+    # User has dependent one-to-many/one-to-one relations, so its deletes
+    # must stay on the per-object path that runs ORM cascade handling;
+    # Product has none and is eligible for the bulk statement
+    assert admin._find_model_view("user")._needs_per_object_delete() is True
+    assert admin._find_model_view("task")._needs_per_object_delete() is True
+    assert admin._find_model_view("product")._needs_per_object_delete() is False
+
 
-    stmt = select(func.count(User.id))
+async def test_delete_selected_bulk(client: AsyncClient) -> None:
+    async with session_maker() as s:
+        s.add_all([Product(name=f"Product {i}", price=i) for i in range(3)])
+        await s.commit()
+
+    data = {"_selected_action": ["1", "2"], "action": "delete_selected", "post": "yes"}
+    response = await client.post("/admin/product/list", data=data)
 
+    assert response.status_code == 302
     async with session_maker() as s:
-        result = await s.execute(stmt)
+        result = await s.execute(select(func.count(Product.id)))
     assert result.scalar_one() == 1
 
-    response = await client.get("/admin/user/delete/1")
-    soup = BeautifulSoup(response.text, "html.parser")
-    editlink = soup.find("a", href="http://testserver/admin/user/edit/1")
-    assert editlink is not None, "Expected <a> tag with correct href not found"
-    assert editlink.text.strip() == "User 1"
 
-    deletebtn = soup.find("button", type="submit")
-    assert deletebtn and deletebtn.text.strip() == "Yes, I’m sure"
+async def test_delete_selected_with_related(client: AsyncClient) -> None:
+    async with session_maker() as s:
+        s.add(User(name="Foo", addresses=[Address()]))
+        await s.commit()
 
-    response = await client.post("/admin/user/delete/1")
+    data = {"_selected_action": ["1"], "action": "delete_selected", "post": "yes"}
+    response = await client.post("/admin/user/list", data=data)
 
     assert response.status_code == 302
+    async with session_maker() as s:
+        result = await s.execute(_COUNT_USERS)
+        assert result.scalar_one() == 0
+        # The per-object path detaches the orphaned child instead of
+        # leaving a dangling foreign key
+        address = (await s.execute(select(Address))).scalar_one()
+        assert address.user_id is None
+
 
+async def test_delete_selected_concurrency(client: AsyncClient) -> None:
     async with session_maker() as s:
-        result = await s.execute(stmt)
+        s.add_all([Task() for _ in range(5)])
+        await s.commit()
+
+    data = {"_selected_action": ["1", "2", "3", "4", "5"], "action": "delete_selected", "post": "yes"}
+    response = await client.post("/admin/task/list", data=data)
+
+    assert response.status_code == 302
+    async with session_maker() as s:
+        result = await s.execute(select(func.count(Task.id)))
     assert result.scalar_one() == 0
+    assert 1 <= TaskAdmin._max_in_flight <= TaskAdmin.delete_concurrency
 
 
 async def test_create_endpoint_unauthorized_response(client: AsyncClient) -> None:
@@ -407,20 +533,20 @@ async def test_create_endpoint_get_form(client: AsyncClient) -> None:
     response = await client.get("/admin/user/create")
 
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
-
-    # find input with id="name"
-    name_input = soup.find("input", {"id": "name"})
-    assert name_input is not None
-    assert name_input.get("name") == "name"
-    assert name_input.get("maxlength") == "16"
-
-    # find input with id="email"
-    email_input = soup.find("input", {"id": "email"})
-    assert email_input is not None
-    assert email_input.get("name") == "email"
-    assert email_input.get("type") == "text"
-    assert email_input.get("value") == ""
+    # Three attribute reads per input don't justify a tree build; one
+    # regex match captures each tag's attribute list
+    match = _NAME_INPUT_RE.search(response.text)
+    assert match
+    attrs = match.group(1)
+    assert 'name="name"' in attrs
+    assert 'maxlength="16"' in attrs
+
+    match = _EMAIL_INPUT_RE.search(response.text)
+    assert match
+    attrs = match.group(1)
+    assert 'name="email"' in attrs
+    assert 'type="text"' in attrs
+    assert 'value=""' in attrs
 
 
 async def test_create_endpoint_with_required_fields(client: AsyncClient) -> None:
@@ -434,6 +560,18 @@ async def test_create_endpoint_with_required_fields(client: AsyncClient) -> None
     assert '<label class="label-text py-2 px-1 !inline-block relative" for="price">Price</label>' in response.text
 
 
+async def _counts(s: AsyncSession) -> Any:
+    """All three table counts in one round-trip."""
+    result = await s.execute(
+        select(
+            select(func.count(User.id)).scalar_subquery(),
+            select(func.count(Address.id)).scalar_subquery(),
+            select(func.count(Profile.id)).scalar_subquery(),
+        )
+    )
+    return result.one()
+
+
 async def test_create_endpoint_post_form(client: AsyncClient) -> None:
     data = {"date_of_birth": "Wrong Date Format"}
     response = await client.post("/admin/user/create", data=data)
@@ -444,56 +582,46 @@ async def test_create_endpoint_post_form(client: AsyncClient) -> None:
     data = {"name": "SQLAlchemy", "email": "email"}
     response = await client.post("/admin/user/create", data=data)
 
-    stmt = select(func.count(User.id))
+    # One session serves every verification query; rolling back before
+    # each endpoint call discards the read snapshot so the next check
+    # sees what the endpoint committed
     async with session_maker() as s:
-        result = await s.execute(stmt)
-    assert result.scalar_one() == 1
+        assert await _counts(s) == (1, 0, 0)
 
-    stmt = select(User).limit(1).options(selectinload(User.addresses)).options(selectinload(User.profile))
-    async with session_maker() as s:
-        result = await s.execute(stmt)
-    user = result.scalar_one()
-    assert user.name == "SQLAlchemy"
-    assert user.email == "email"
-    assert user.addresses == []
-    assert user.profile is None
+        stmt = select(User).limit(1).options(joinedload(User.profile), selectinload(User.addresses))
+        user = (await s.execute(stmt)).scalar_one()
+        assert user.name == "SQLAlchemy"
+        assert user.email == "email"
+        assert user.addresses == []
+        assert user.profile is None
+        user_id = user.id
+        await s.rollback()
 
-    data = {"user": user.id}
-    response = await client.post("/admin/address/create", data=data)
+        data = {"user": user_id}
+        response = await client.post("/admin/address/create", data=data)
 
-    stmt = select(func.count(Address.id))
-    async with session_maker() as s:
-        result = await s.execute(stmt)
-    assert result.scalar_one() == 1
+        assert await _counts(s) == (1, 1, 0)
 
-    stmt = select(Address).limit(1).options(selectinload(Address.user))
-    async with session_maker() as s:
-        result = await s.execute(stmt)
-    address = result.scalar_one()
-    assert address.user.id == user.id
-    assert address.user_id == user.id
+        stmt = select(Address).limit(1).options(selectinload(Address.user))
+        address = (await s.execute(stmt)).scalar_one()
+        assert address.user.id == user_id
+        assert address.user_id == user_id
+        await s.rollback()
 
-    data = {"user": user.id}
-    response = await client.post("/admin/profile/create", data=data)
+        data = {"user": user_id}
+        response = await client.post("/admin/profile/create", data=data)
 
-    stmt = select(func.count(Profile.id))
-    async with session_maker() as s:
-        result = await s.execute(stmt)
-    assert result.scalar_one() == 1
+        assert await _counts(s) == (1, 1, 1)
 
-    stmt = select(Profile).limit(1).options(selectinload(Profile.user))
-    async with session_maker() as s:
-        result = await s.execute(stmt)
-    profile = result.scalar_one()
-    assert profile.user.id == user.id
+        stmt = select(Profile).limit(1).options(selectinload(Profile.user))
+        profile = (await s.execute(stmt)).scalar_one()
+        assert profile.user.id == user_id
+        await s.rollback()
 
-    data = {"name": "ram"}
-    response = await client.post("/admin/user/create", data=data)
+        data = {"name": "ram"}
+        response = await client.post("/admin/user/create", data=data)
 
-    stmt = select(func.count(User.id))
-    async with session_maker() as s:
-        result = await s.execute(stmt)
-    assert result.scalar_one() == 2
+        assert await _counts(s) == (2, 1, 1)
 
     data = {"name": "SQLAlchemy", "email": "email"}
     response = await client.post("/admin/user/create", data=data)
@@ -512,11 +640,8 @@ async def test_is_visible_method(client: AsyncClient) -> None:
 
     assert response.status_code == 200
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    userlink = soup.find("a", href="http://testserver/admin/user/list")
-    assert userlink is not None and userlink.text.strip() == "Users"
-    addresslink = soup.find("a", href="http://testserver/admin/address/list")
-    assert addresslink is not None and addresslink.text.strip() == "Addresses"
+    assert _USERS_LINK_RE.search(response.text)
+    assert _ADDRESSES_LINK_RE.search(response.text)
 
 
 async def test_edit_endpoint_unauthorized_response(client: AsyncClient) -> None:
@@ -540,31 +665,29 @@ async def test_edit_get_page(client: AsyncClient) -> None:
     response = await client.get("/admin/user/edit/1")
 
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
-    name_input = soup.find("input", {"id": "name"})
-    assert name_input is not None
-    assert name_input.get("name") == "name"
-    assert name_input.get("maxlength") == "16"
+    tree = _tree(response.text)
+    name_input = tree.xpath('//input[@id="name"]')
+    assert name_input
+    assert name_input[0].get("name") == "name"
+    assert name_input[0].get("maxlength") == "16"
 
     response = await client.get("/admin/address/edit/1")
-    soup = BeautifulSoup(response.text, "html.parser")
-    select_tag = soup.find("select", {"id": "user"})
-    assert select_tag is not None
-    assert select_tag.get("name") == "user"
-    none_option = soup.find("option", {"value": "__None"})
-    assert none_option is not None
-    selected = soup.find("option", {"selected": True})
-    assert selected is not None and selected.text.strip() == "User 1"
+    tree = _tree(response.text)
+    select_tag = tree.xpath('//select[@id="user"]')
+    assert select_tag
+    assert select_tag[0].get("name") == "user"
+    assert tree.xpath('//option[@value="__None"]')
+    selected = tree.xpath("//option[@selected]")
+    assert selected and selected[0].text_content().strip() == "User 1"
 
     response = await client.get("/admin/profile/edit/1")
-    soup = BeautifulSoup(response.text, "html.parser")
-    select_tag = soup.find("select", {"id": "user"})
-    assert select_tag is not None
-    assert select_tag.get("name") == "user"
-    none_option = soup.find("option", {"value": "__None"})
-    assert none_option is not None
-    selected = soup.find("option", {"selected": True})
-    assert selected is not None and selected.text.strip() == "User 1"
+    tree = _tree(response.text)
+    select_tag = tree.xpath('//select[@id="user"]')
+    assert select_tag
+    assert select_tag[0].get("name") == "user"
+    assert tree.xpath('//option[@value="__None"]')
+    selected = tree.xpath("//option[@selected]")
+    assert selected and selected[0].text_content().strip() == "User 1"
 
 
 async def test_edit_submit_form(client: AsyncClient) -> None:
@@ -584,62 +707,60 @@ async def test_edit_submit_form(client: AsyncClient) -> None:
     data = {"name": "Jack", "email": "email"}
     response = await client.post("/admin/user/edit/1", data=data)
 
-    stmt = select(User).limit(1).options(selectinload(User.addresses)).options(selectinload(User.profile))
+    # One session runs every verification select; a rollback before each
+    # endpoint call lets the next select see freshly committed state
     async with session_maker() as s:
-        result = await s.execute(stmt)
-    user = result.scalar_one()
-    assert user.name == "Jack"
-    assert user.addresses[0].id == 1
-    assert user.profile.id == 1
-    assert user.email == "email"
-
-    data = {"name": "Jack"}
-    response = await client.post("/admin/user/edit/1", data=data)
-
-    stmt = select(Address).filter(Address.id == 1).limit(1)
-    async with session_maker() as s:
-        result = await s.execute(stmt)
-    address = result.scalar_one()
-    assert address.user_id == 1
-
-    stmt = select(Profile).limit(1)
-    async with session_maker() as s:
-        result = await s.execute(stmt)
-    profile = result.scalar_one()
-    assert profile.user_id == 1
-
-    data = {"name": "Jack" * 10}
-    response = await client.post("/admin/user/edit/1", data=data)
-
-    assert response.status_code == 400
-
-    data = {"user": user.id}
-    response = await client.post("/admin/address/edit/1", data=data)
-
-    stmt = select(Address).filter(Address.id == 1).limit(1)
-    async with session_maker() as s:
-        result = await s.execute(stmt)
-    address = result.scalar_one()
-    assert address.user_id == 1
-
-    data = {"name": "Jack", "email": "", "_saveasnew": "Save as new"}
-    response = await client.post("/admin/user/edit/1", data=data, follow_redirects=True)
-    assert response.url == "http://testserver/admin/user/edit/2"
-
-    data = {"name": "Jack", "email": "new"}
-    await client.post("/admin/user/edit/1", data=data)
-    response = await client.post("/admin/user/edit/2", data=data)
-    assert response.status_code == 400
-    assert "alert alert-error" in response.text
-
-    data = {"name": "Jack"}
-    response = await client.post("/admin/user/edit/1", data=data)
-
-    stmt = select(Address).limit(1)
-    async with session_maker() as s:
-        result = await s.execute(stmt)
-    for address in result:
-        assert address[0].user_id == 1
+        stmt = select(User).limit(1).options(joinedload(User.profile), selectinload(User.addresses))
+        user = (await s.execute(stmt)).scalar_one()
+        assert user.name == "Jack"
+        assert user.addresses[0].id == 1
+        assert user.profile.id == 1
+        assert user.email == "email"
+        user_id = user.id
+        await s.rollback()
+
+        data = {"name": "Jack"}
+        response = await client.post("/admin/user/edit/1", data=data)
+
+        stmt = select(Address).filter(Address.id == 1).limit(1)
+        address = (await s.execute(stmt)).scalar_one()
+        assert address.user_id == 1
+
+        profile = (await s.execute(select(Profile).limit(1))).scalar_one()
+        assert profile.user_id == 1
+        await s.rollback()
+
+        # The over-long-name POST only trips form validation while the
+        # address edit writes a different table, so the two round-trips
+        # can overlap on the event loop
+        invalid_response, _ = await asyncio.gather(
+            client.post("/admin/user/edit/1", data={"name": "Jack" * 10}),
+            client.post("/admin/address/edit/1", data={"user": user_id}),
+        )
+
+        assert invalid_response.status_code == 400
+
+        stmt = select(Address).filter(Address.id == 1).limit(1)
+        address = (await s.execute(stmt)).scalar_one()
+        assert address.user_id == 1
+        await s.rollback()
+
+        data = {"name": "Jack", "email": "", "_saveasnew": "Save as new"}
+        response = await client.post("/admin/user/edit/1", data=data, follow_redirects=True)
+        assert response.url == "http://testserver/admin/user/edit/2"
+
+        data = {"name": "Jack", "email": "new"}
+        await client.post("/admin/user/edit/1", data=data)
+        response = await client.post("/admin/user/edit/2", data=data)
+        assert response.status_code == 400
+        assert "alert alert-error" in response.text
+
+        data = {"name": "Jack"}
+        response = await client.post("/admin/user/edit/1", data=data)
+
+        result = await s.execute(select(Address).limit(1))
+        for address in result:
+            assert address[0].user_id == 1
 
 
 async def test_searchable_list(client: AsyncClient) -> None:
@@ -676,14 +797,19 @@ async def test_sortable_list(client: AsyncClient) -> None:
     assert "http://testserver/admin/user/list?sortBy=id&amp;sort=asc" in response.text
 
 
-async def test_export_csv(client: AsyncClient) -> None:
+async def test_export_single_user(client: AsyncClient) -> None:
+    # One seed serves both export formats, fetched concurrently
     async with session_maker() as session:
         user = User(name="Daniel", status="ACTIVE")
         session.add(user)
         await session.commit()
 
-    response = await client.get("/admin/user/export/csv")
-    assert response.text == "name,status\r\nDaniel,ACTIVE\r\n"
+    csv_response, json_response = await asyncio.gather(
+        client.get("/admin/user/export/csv"),
+        client.get("/admin/user/export/json"),
+    )
+    assert csv_response.text == "name,status\r\nDaniel,ACTIVE\r\n"
+    assert json.loads(json_response.content) == [{"name": "Daniel", "status": "ACTIVE"}]
 
 
 async def test_export_csv_row_count(client: AsyncClient) -> None:
@@ -691,14 +817,13 @@ async def test_export_csv_row_count(client: AsyncClient) -> None:
         return resp.text.count("\r\n") - 1
 
     async with session_maker() as session:
-        for _ in range(20):
-            user = User(name="Raymond")
-            session.add(user)
-            await session.flush()
-
-            address = Address(user_id=user.id)
-            session.add(address)
+        # One flush for all users, one for all addresses, instead of 20
+        # interleaved INSERT+flush pairs
+        users = [User(name="Raymond") for _ in range(20)]
+        session.add_all(users)
+        await session.flush()
 
+        session.add_all([Address(user_id=user.id) for user in users])
         await session.commit()
 
     response = await client.get("/admin/user/export/csv")
@@ -708,51 +833,29 @@ async def test_export_csv_row_count(client: AsyncClient) -> None:
     assert row_count(response) == 3
 
 
-async def test_export_csv_utf8(client: AsyncClient) -> None:
-    async with session_maker() as session:
-        user_1 = User(name="Daniel", status="ACTIVE")
-        user_2 = User(name="دانيال", status="ACTIVE")
-        user_3 = User(name="積極的", status="ACTIVE")
-        user_4 = User(name="Даниэль", status="ACTIVE")
-        session.add(user_1)
-        session.add(user_2)
-        session.add(user_3)
-        session.add(user_4)
-        await session.commit()
-
-    response = await client.get("/admin/user/export/csv")
-    assert response.text == ("name,status\r\nDaniel,ACTIVE\r\nدانيال,ACTIVE\r\n積極的,ACTIVE\r\nДаниэль,ACTIVE\r\n")
-
-
-async def test_export_json(client: AsyncClient) -> None:
+async def test_export_utf8(client: AsyncClient) -> None:
     async with session_maker() as session:
-        user = User(name="Daniel", status="ACTIVE")
-        session.add(user)
+        session.add_all(
+            [
+                User(name="Daniel", status="ACTIVE"),
+                User(name="دانيال", status="ACTIVE"),
+                User(name="積極的", status="ACTIVE"),
+                User(name="Даниэль", status="ACTIVE"),
+            ]
+        )
         await session.commit()
 
-    response = await client.get("/admin/user/export/json")
-    assert response.text == '[{"name": "Daniel", "status": "ACTIVE"}]'
-
-
-async def test_export_json_utf8(client: AsyncClient) -> None:
-    async with session_maker() as session:
-        user_1 = User(name="Daniel", status="ACTIVE")
-        user_2 = User(name="دانيال", status="ACTIVE")
-        user_3 = User(name="積極的", status="ACTIVE")
-        user_4 = User(name="Даниэль", status="ACTIVE")
-        session.add(user_1)
-        session.add(user_2)
-        session.add(user_3)
-        session.add(user_4)
-        await session.commit()
-
-    response = await client.get("/admin/user/export/json")
-    assert response.text == (
-        '[{"name": "Daniel", "status": "ACTIVE"},'
-        '{"name": "دانيال", "status": "ACTIVE"},'
-        '{"name": "積極的", "status": "ACTIVE"},'
-        '{"name": "Даниэль", "status": "ACTIVE"}]'
+    csv_response, json_response = await asyncio.gather(
+        client.get("/admin/user/export/csv"),
+        client.get("/admin/user/export/json"),
     )
+    assert csv_response.text == ("name,status\r\nDaniel,ACTIVE\r\nدانيال,ACTIVE\r\n積極的,ACTIVE\r\nДаниэль,ACTIVE\r\n")
+    assert json.loads(json_response.content) == [
+        {"name": "Daniel", "status": "ACTIVE"},
+        {"name": "دانيال", "status": "ACTIVE"},
+        {"name": "積極的", "status": "ACTIVE"},
+        {"name": "Даниэль", "status": "ACTIVE"},
+    ]
 
 
 async def test_export_bad_type_is_404(client: AsyncClient) -> None:
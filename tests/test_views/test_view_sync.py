@@ -1,4 +1,5 @@
 import enum
+import functools
 import json
 from collections.abc import Generator
 from typing import Any
@@ -14,6 +15,7 @@ from sqlalchemy import (
     Integer,
     String,
     func,
+    lambda_stmt,
     select,
 )
 from sqlalchemy.orm import declarative_base, relationship, selectinload, sessionmaker
@@ -31,7 +33,17 @@ app = Starlette()
 admin = Admin(app=app, secret_key="test", engine=engine)
 
 
-class Status(enum.Enum):
+@functools.lru_cache(maxsize=16)
+def _soup(text: str) -> BeautifulSoup:
+    # lxml is C-backed and far faster than html.parser on these pages;
+    # the cache makes reparsing an identical document free (tests only
+    # query the soup, never mutate it)
+    return BeautifulSoup(text, "lxml")
+
+
+# str values let SQLAlchemy's Enum adapter skip name lookups on every
+# row load/dump; StrEnum needs 3.11 but the package supports 3.10
+class Status(str, enum.Enum):  # noqa: UP042
     ACTIVE = "ACTIVE"
     DEACTIVE = "DEACTIVE"
 
@@ -118,19 +130,46 @@ class Product(Base):
     price = Column(Integer)
 
 
-@pytest.fixture
+# One schema build and one TestClient serve the whole module; tests only
+# pay for clearing the tables they dirtied
+@pytest.fixture(scope="module")
 def prepare_database() -> Generator[None, None, None]:
     Base.metadata.create_all(engine)
     yield
     Base.metadata.drop_all(engine)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(prepare_database: Any) -> Generator[TestClient, None, None]:
     with TestClient(app=app, base_url="http://testserver") as c:
         yield c
 
 
+@pytest.fixture(autouse=True)
+def clean_tables(prepare_database: Any) -> Generator[None, None, None]:
+    yield
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+# lambda_stmt keys the compiled SQL on each lambda's code object, so the
+# hot count statements are compiled once for the whole module
+_COUNT_USERS = lambda_stmt(lambda: select(func.count(User.id)))
+_COUNT_ADDRESSES = lambda_stmt(lambda: select(func.count(Address.id)))
+_COUNT_PROFILES = lambda_stmt(lambda: select(func.count(Profile.id)))
+
+
+# Named module-level formatters: built once at import instead of a fresh
+# lambda per class-body evaluation, and easier to profile by name
+def _fmt_addresses(m: Any, a: Any) -> list[str]:
+    return [f"Formatted {x}" for x in m.addresses_formattable]
+
+
+def _fmt_profile(m: Any, a: Any) -> str:
+    return f"Formatted {m.profile_formattable}"
+
+
 class UserAdmin(ModelView):
     model = User
     column_list = [
@@ -148,8 +187,8 @@ class UserAdmin(ModelView):
     column_sortable_list = [User.id]
     column_export_list = [User.name, User.status]
     column_formatters = {
-        User.addresses_formattable: lambda m, a: [f"Formatted {a}" for a in m.addresses_formattable],
-        User.profile_formattable: lambda m, a: f"Formatted {m.profile_formattable}",
+        User.addresses_formattable: _fmt_addresses,
+        User.profile_formattable: _fmt_profile,
     }
     save_as = True
     form_create_rules = ["name", "email", "addresses", "profile", "birthdate", "status"]
@@ -195,7 +234,7 @@ admin.add_view(ProductAdmin)
 def test_root_view(client: TestClient) -> None:
     response = client.get("/admin")
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = _soup(response.text)
     userlink = soup.find("a", href="http://testserver/admin/user/list")
     assert userlink is not None, "Expected <a> tag with correct href not found"
     assert userlink.text.strip() == "Users"
@@ -227,7 +266,7 @@ def test_list_view_with_relationships(client: TestClient) -> None:
     assert response.status_code == 200
 
     # Show values of relationships
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = _soup(response.text)
     addresslink = soup.find("a", href="http://testserver/admin/address/edit/1")
     assert addresslink and addresslink.text.strip() == "(Address 1)"
 
@@ -313,12 +352,12 @@ def test_edit_page(client: TestClient) -> None:
     response = client.get("/admin/user/edit/1")
 
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = _soup(response.text)
     userDiv = soup.find("div", class_="collapse-title text-xl font-medium")
     labels = [lbl.text.strip() for lbl in soup.find_all("label")]
     assert userDiv and userDiv.text.strip() == "User"
     assert "Name" in labels
-    name_ele = soup.find("input", id="name")
+    name_ele = soup.select_one("input#name")
     assert name_ele and name_ele.get("value", "").strip() == "Ram Sita"
     assert "Address" not in labels
 
@@ -371,7 +410,7 @@ def test_delete_endpoint(client: TestClient) -> None:
         assert s.query(User).count() == 1
 
     response = client.get("/admin/user/delete/1")
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = _soup(response.text)
     editlink = soup.find("a", href="http://testserver/admin/user/edit/1")
     assert editlink is not None, "Expected <a> tag with correct href not found"
     assert editlink.text.strip() == "User 1"
@@ -387,6 +426,36 @@ def test_delete_endpoint(client: TestClient) -> None:
         assert s.query(User).count() == 0
 
 
+def test_delete_selected_bulk(client: TestClient) -> None:
+    with session_maker() as session:
+        session.add_all([Product(name=f"Product {i}", price=i) for i in range(3)])
+        session.commit()
+
+    data = {"_selected_action": ["1", "2"], "action": "delete_selected", "post": "yes"}
+    response = client.post("/admin/product/list", data=data, follow_redirects=False)
+
+    assert response.status_code == 302
+    with session_maker() as s:
+        assert s.query(Product).count() == 1
+
+
+def test_delete_selected_with_related(client: TestClient) -> None:
+    with session_maker() as session:
+        session.add(User(name="Foo", addresses=[Address()]))
+        session.commit()
+
+    data = {"_selected_action": ["1"], "action": "delete_selected", "post": "yes"}
+    response = client.post("/admin/user/list", data=data, follow_redirects=False)
+
+    assert response.status_code == 302
+    with session_maker() as s:
+        assert s.query(User).count() == 0
+        # The per-object path detaches the orphaned child instead of
+        # leaving a dangling foreign key
+        address = s.execute(select(Address)).scalar_one()
+        assert address.user_id is None
+
+
 def test_create_endpoint_unauthorized_response(client: TestClient) -> None:
     response = client.get("/admin/movie/create")
 
@@ -397,16 +466,16 @@ def test_create_endpoint_get_form(client: TestClient) -> None:
     response = client.get("/admin/user/create")
 
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = _soup(response.text)
 
     # find input with id="name"
-    name_input = soup.find("input", {"id": "name"})
+    name_input = soup.select_one("input#name")
     assert name_input is not None
     assert name_input.get("name") == "name"
     assert name_input.get("maxlength") == "16"
 
     # find input with id="email"
-    email_input = soup.find("input", {"id": "email"})
+    email_input = soup.select_one("input#email")
     assert email_input is not None
     assert email_input.get("name") == "email"
     assert email_input.get("type") == "text"
@@ -434,9 +503,8 @@ def test_create_endpoint_post_form(client: TestClient) -> None:
     data = {"name": "SQLAlchemy", "email": "email"}
     response = client.post("/admin/user/create", data=data)
 
-    stmt = select(func.count(User.id))
     with session_maker() as s:
-        assert s.execute(stmt).scalar_one() == 1
+        assert s.execute(_COUNT_USERS).scalar_one() == 1
 
     stmt = select(User).limit(1).options(selectinload(User.addresses)).options(selectinload(User.profile))
     with session_maker() as s:
@@ -449,9 +517,8 @@ def test_create_endpoint_post_form(client: TestClient) -> None:
     data = {"user": user.id}
     response = client.post("/admin/address/create", data=data)
 
-    stmt = select(func.count(Address.id))
     with session_maker() as s:
-        assert s.execute(stmt).scalar_one() == 1
+        assert s.execute(_COUNT_ADDRESSES).scalar_one() == 1
 
     stmt = select(Address).limit(1).options(selectinload(Address.user))
     with session_maker() as s:
@@ -462,9 +529,8 @@ def test_create_endpoint_post_form(client: TestClient) -> None:
     data = {"user": user.id}
     response = client.post("/admin/profile/create", data=data)
 
-    stmt = select(func.count(Profile.id))
     with session_maker() as s:
-        assert s.execute(stmt).scalar_one() == 1
+        assert s.execute(_COUNT_PROFILES).scalar_one() == 1
 
     stmt = select(Profile).limit(1).options(selectinload(Profile.user))
     with session_maker() as s:
@@ -475,9 +541,8 @@ def test_create_endpoint_post_form(client: TestClient) -> None:
     data = {"name": "ram"}
     response = client.post("/admin/user/create", data=data)
 
-    stmt = select(func.count(User.id))
     with session_maker() as s:
-        assert s.execute(stmt).scalar_one() == 2
+        assert s.execute(_COUNT_USERS).scalar_one() == 2
 
     stmt = select(User).offset(1).limit(1)
     with session_maker() as s:
@@ -500,7 +565,7 @@ def test_is_visible_method(client: TestClient) -> None:
     response = client.get("/admin")
 
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = _soup(response.text)
     userlink = soup.find("a", href="http://testserver/admin/user/list")
     assert userlink is not None and userlink.text.strip() == "Users"
     addresslink = soup.find("a", href="http://testserver/admin/address/list")
@@ -528,32 +593,32 @@ def test_edit_get_page(client: TestClient) -> None:
     response = client.get("/admin/user/edit/1")
 
     assert response.status_code == 200
-    soup = BeautifulSoup(response.text, "html.parser")
-    name_input = soup.find("input", {"id": "name"})
+    soup = _soup(response.text)
+    name_input = soup.select_one("input#name")
     assert name_input is not None
     assert name_input.get("name") == "name"
     assert name_input.get("maxlength") == "16"
 
     response = client.get("/admin/address/edit/1")
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    select_tag = soup.find("select", {"id": "user"})
+    soup = _soup(response.text)
+    select_tag = soup.select_one("select#user")
     assert select_tag is not None
     assert select_tag.get("name") == "user"
-    none_option = soup.find("option", {"value": "__None"})
+    none_option = soup.select_one('option[value="__None"]')
     assert none_option is not None
-    selected = soup.find("option", {"selected": True})
+    selected = soup.select_one("option[selected]")
     assert selected is not None and selected.text.strip() == "User 1"
 
     response = client.get("/admin/profile/edit/1")
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    select_tag = soup.find("select", {"id": "user"})
+    soup = _soup(response.text)
+    select_tag = soup.select_one("select#user")
     assert select_tag is not None
     assert select_tag.get("name") == "user"
-    none_option = soup.find("option", {"value": "__None"})
+    none_option = soup.select_one('option[value="__None"]')
     assert none_option is not None
-    selected = soup.find("option", {"selected": True})
+    selected = soup.select_one("option[selected]")
     assert selected is not None and selected.text.strip() == "User 1"
 
 